@@ -6,6 +6,7 @@ Lightweight utilities used in the public synthesis of D7.4:
 - data_explosion: aligned multi-value "data explosion" (public version)
 - temporal_features: timezone-aware parsing & temporal features
 - data_validation: minimal schema checks and ID normalization
+- pipeline: lazy (Dask) loading pipeline for large CSVs
 
 NOTE: Advanced feature engineering, conflict resolution, learned encoders,
 and production pipelines (82% DL severity prediction, clustering, etc.)
@@ -16,6 +17,8 @@ from .data_explosion import (
     detect_multivalue_columns,
     explode_aligned_columns,
     one_hot_multivalue_columns,
+    clear_token_cache,
+    set_token_cache_size,
 )
 
 from .temporal_features import (
@@ -33,11 +36,15 @@ from .data_validation import (
     normalize_id_column,
 )
 
+from .pipeline import build_pipeline
+
 __all__ = [
     # data_explosion
     "detect_multivalue_columns",
     "explode_aligned_columns",
     "one_hot_multivalue_columns",
+    "clear_token_cache",
+    "set_token_cache_size",
     # temporal_features
     "parse_datetime_column",
     "add_temporal_features",
@@ -49,4 +56,6 @@ __all__ = [
     "coerce_numeric_columns",
     "basic_quality_report",
     "normalize_id_column",
+    # pipeline
+    "build_pipeline",
 ]
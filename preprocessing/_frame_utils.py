@@ -0,0 +1,43 @@
+"""
+LeADS D7.4 – Internal DataFrame helpers (Phase 1)
+MIT License
+
+Shared by the preprocessing modules; not part of the public API.
+"""
+
+from __future__ import annotations
+from typing import Dict
+import pandas as pd
+
+_PANDAS_GE_3 = int(pd.__version__.split(".")[0]) >= 3
+
+
+def _copy_on_write() -> bool:
+    """True if pandas copy-on-write is active (always on from pandas 3.0)."""
+    return _PANDAS_GE_3 or getattr(pd.options.mode, "copy_on_write", False) is True
+
+
+def _result_frame(df: pd.DataFrame, inplace: bool) -> pd.DataFrame:
+    """
+    Frame to write results into: `df` itself if inplace=True, otherwise an
+    independent copy (a cheap shallow one when copy-on-write is active).
+    """
+    if inplace:
+        return df
+    return df.copy(deep=not _copy_on_write())
+
+
+def _attach_columns(df: pd.DataFrame, new_cols: Dict[str, object], inplace: bool) -> pd.DataFrame:
+    """
+    Add several derived columns at once. New columns are appended as a single
+    consolidated block; if inplace=True or any name already exists, they are
+    set one by one so existing positions are kept.
+    """
+    if inplace or any(c in df.columns for c in new_cols):
+        out = _result_frame(df, inplace)
+        for c, values in new_cols.items():
+            out[c] = values
+        return out
+    block = pd.DataFrame(new_cols, index=df.index)
+    # copies `df` unless copy-on-write is active, like DataFrame.assign
+    return pd.concat([df, block], axis=1)
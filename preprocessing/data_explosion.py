@@ -14,14 +14,33 @@ Key capabilities
 Notes
 -----
 - Default separator is ',' to match the shared EDA and sample dataset.
+- If pyarrow is installed, tokenization and separator scans run as Arrow
+  string kernels; otherwise the pandas/Python fallback gives the same result.
+- Tokenized columns are cached between calls (4 columns by default); use
+  set_token_cache_size(0) to disable it or clear_token_cache() to free it.
 - Full, publication-grade encoders (e.g., token normalization, weighting,
   rare-token grouping, and reconciliation across tables) come in Phase 2.
 """
 
 from __future__ import annotations
-from typing import Iterable, List, Dict, Optional, Set
+from collections import OrderedDict
+import hashlib
+from itertools import chain
+import threading
+from typing import Iterable, List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from ._frame_utils import _attach_columns
+
+try:  # optional: Arrow string kernels
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - falls back to pandas string ops
+    pa = None
+    pc = None
+
+
 def detect_multivalue_columns(
     df: pd.DataFrame,
     candidate_columns: Optional[Iterable[str]] = None,
@@ -32,35 +51,110 @@ def detect_multivalue_columns(
     if candidate_columns is None:
         candidate_columns = [c for c in df.columns if df[c].dtype == "object"]
 
-    flagged: List[str] = []
-    for c in candidate_columns:
-        s = df[c].dropna().astype(str)
-        share = (s.str.contains(sep, regex=False)).mean() if len(s) else 0.0
-        if share >= min_share:
-            flagged.append(c)
-    return flagged
+    return [c for c in candidate_columns if _multivalue_share(df[c], sep) >= min_share]
+
+
+def _multivalue_share(s: pd.Series, sep: str) -> float:
+    """Share of non-null cells containing the separator."""
+    s = s.dropna().astype(str)
+    if not len(s):
+        return 0.0
+    if pa is not None:
+        arr = pa.array(s.to_numpy(dtype=object), type=pa.string())
+        hits = pc.greater(pc.count_substring(arr, sep), 0)
+        return pc.mean(pc.cast(hits, pa.float64())).as_py()
+    arr = s.to_numpy(dtype=object)
+    hits = np.fromiter((sep in x for x in arr), dtype=np.bool_, count=len(arr))
+    return float(hits.mean())
+
+
+# Small LRU of tokenized columns, keyed by column content + separator, so
+# e.g. explode_aligned_columns followed by one_hot_multivalue_columns on the
+# same fields splits them only once. Each entry keeps every token of its column
+# alive (roughly the size of the column's strings), so the default holds at most
+# 4 columns; see set_token_cache_size / clear_token_cache.
+_TOKEN_CACHE_SIZE = 4
+_TOKEN_CACHE: "OrderedDict[Tuple[bytes, int, str], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
 
 
-def _split_to_list(x: object, sep: str) -> List[str]:
-    """Split a cell into a list, keeping empty->[]; cast to str safely."""
-    if pd.isna(x):
-        return []
-    parts = str(x).split(sep)
-    # Strip and drop pure-empty tokens
-    return [p.strip() for p in parts if p is not None and p.strip() != ""]
+def clear_token_cache() -> None:
+    """Drop all cached tokenizations and release the memory they hold."""
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.clear()
 
 
-def _align_lists(row_lists: List[List[str]]) -> List[List[str]]:
+def set_token_cache_size(size: int) -> None:
     """
-    Pad lists in a row to the same length (right-pad with None) so they can be zipped.
-    This makes the explode operation robust to small per-column length mismatches.
+    Set how many tokenized columns are kept between calls (default 4).
+
+    Each entry holds the column's tokens, roughly the memory of its strings.
+    size=0 disables the cache (and the content hashing used to key it).
+    Shrinking evicts the least recently used entries immediately.
+    """
+    global _TOKEN_CACHE_SIZE
+    if size < 0:
+        raise ValueError("size must be >= 0")
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE_SIZE = int(size)
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+
+
+def _tokenize_column(s: pd.Series, sep: str) -> Tuple[np.ndarray, np.ndarray]:
     """
-    max_len = max((len(L) for L in row_lists), default=0)
-    aligned = []
-    for L in row_lists:
-        padded = L + [None] * (max_len - len(L))
-        aligned.append(padded)
-    return aligned
+    Split a whole column into stripped, non-empty tokens (NaN -> no tokens).
+
+    Returns the flat token array (object dtype) and the per-row token counts:
+    row i owns the next lengths[i] entries of the flat array. Both arrays are
+    read-only since results are shared through the token cache.
+    """
+    if _TOKEN_CACHE_SIZE == 0:
+        flat, lengths = _split_column(s, sep)
+        flat.flags.writeable = False
+        lengths.flags.writeable = False
+        return flat, lengths
+
+    # Hashing the values is far cheaper than splitting them, and unlike an
+    # id()-based key it cannot go stale when the column is modified in place.
+    values = s.to_numpy(dtype=object)
+    digest = hashlib.blake2b(pd.util.hash_array(values).tobytes(), digest_size=16).digest()
+    key = (digest, len(values), sep)
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+        if cached is not None:
+            _TOKEN_CACHE.move_to_end(key)
+            return cached
+
+    # Split outside the lock; two threads may tokenize the same column once each
+    flat, lengths = _split_column(s, sep)
+    flat.flags.writeable = False
+    lengths.flags.writeable = False
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (flat, lengths)
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+    return flat, lengths
+
+
+def _split_column(s: pd.Series, sep: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Uncached tokenization; with pyarrow it runs as Arrow string kernels."""
+    valid = s.notna().to_numpy()
+    if pa is not None:
+        arr = pa.array(s.astype(str).to_numpy(dtype=object), type=pa.string(), mask=~valid)
+        lists = pc.split_pattern(arr, sep)
+        tokens = pc.utf8_trim_whitespace(pc.list_flatten(lists))
+        nonempty = pc.greater(pc.utf8_length(tokens), 0)
+        rows = pc.list_parent_indices(lists).filter(nonempty).to_numpy()
+        flat = tokens.filter(nonempty).to_numpy(zero_copy_only=False).astype(object)
+        return flat, np.bincount(rows, minlength=len(s)).astype(np.int64)
+
+    raw = s.where(valid, "").astype(str).str.split(sep, regex=False)
+    token_lists = [[t for t in map(str.strip, L) if t] for L in raw.to_numpy(dtype=object)]
+    lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+    flat = np.empty(int(lengths.sum()), dtype=object)
+    flat[:] = list(chain.from_iterable(token_lists))
+    return flat, lengths
 
 
 def explode_aligned_columns(
@@ -79,7 +173,9 @@ def explode_aligned_columns(
       Security_measures: "Seat Belt,Helmet"
       User_of_security_measures: "Yes,Yes"
       Sex: "Man,Woman"
-    We split each to lists, align lengths, create tuples per index, then explode.
+    We split each to lists, align lengths (right-padding with None), then emit
+    one row per token position. The explode is driven by an integer (row, slot)
+    index table, so no per-row Python loop is involved.
 
     Parameters
     ----------
@@ -100,44 +196,53 @@ def explode_aligned_columns(
         Exploded frame with original columns preserved and selected columns
         replaced by their exploded single values.
     """
-    out = df.copy()
-
-    # Build combined tuples
-    split_cols = {c: out[c].apply(lambda x: _split_to_list(x, sep)) for c in columns}
-
-    def _combine_row(idx) -> List[tuple]:
-        lists = [split_cols[c].iat[idx] for c in columns]
-        if strict_equal_lengths:
-            lengths = {len(L) for L in lists}
-            if len(lengths) > 1:
-                raise ValueError(f"Row {idx} has unequal token lengths in {columns}: {lengths}")
-            aligned = lists
-        else:
-            aligned = _align_lists(lists)
-        # zip_longest-like (we padded already)
-        tuples = list(zip(*aligned))
-        # Drop all-None tuples
-        tuples = [t for t in tuples if any(v is not None and str(v).strip() != "" for v in t)]
-        return tuples
-
-    combined = [ _combine_row(i) for i in range(len(out)) ]
-    out = out.assign(_combined=combined).explode("_combined", ignore_index=True)
-
-    if not keep_empty_rows:
-        out = out[out["_combined"].notna()]
-
-    # Unpack tuples back to the original columns
-    if len(columns) == 1:
-        # When only one column is passed, _combined is a scalar, not a tuple
-        col = next(iter(columns))
-        out[col] = out["_combined"]
-    else:
-        expanded = pd.DataFrame(out["_combined"].tolist(), columns=list(columns), index=out.index)
-        for c in columns:
-            out[c] = expanded[c]
-
-    out = out.drop(columns=["_combined"]).reset_index(drop=True)
-    return out
+    columns = list(columns)
+
+    # Tokenize each column once; per-row token counts drive the explode
+    tokenized = [_tokenize_column(df[c], sep) for c in columns]
+    lengths = np.vstack([col_lengths for _, col_lengths in tokenized])
+    max_len = lengths.max(axis=0)
+
+    if strict_equal_lengths:
+        bad = np.flatnonzero((lengths != max_len).any(axis=0))
+        if bad.size:
+            idx = int(bad[0])
+            raise ValueError(
+                f"Row {idx} has unequal token lengths in {columns}: {set(lengths[:, idx].tolist())}"
+            )
+
+    # One output row per token slot; rows with no tokens at all either vanish
+    # or (keep_empty_rows) keep a single all-missing slot.
+    counts = np.where(max_len == 0, int(keep_empty_rows), max_len)
+    out_row, out_slot = _explode_index(counts)
+
+    # Gather each column's tokens by (row, slot); shorter lists pad with None.
+    exploded = {}
+    for c, (flat, col_lengths) in zip(columns, tokenized):
+        offsets = np.cumsum(col_lengths) - col_lengths
+        present = out_slot < col_lengths[out_row]
+        values = np.full(len(out_row), None, dtype=object)
+        values[present] = flat[offsets[out_row[present]] + out_slot[present]]
+        exploded[c] = values
+
+    # Other columns are repeated per output row (dtype-preserving gather); the
+    # result is assembled once instead of via take + column overwrites.
+    data = {
+        c: exploded[c] if c in exploded else df[c].array.take(out_row)
+        for c in df.columns
+    }
+    return pd.DataFrame(data, columns=df.columns)
+
+
+def _explode_index(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flat (row, slot) index table for exploding row i into counts[i] rows,
+    e.g. counts [2, 0, 1] -> rows [0, 0, 2], slots [0, 1, 0].
+    """
+    out_row = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    out_slot = np.arange(int(counts.sum())) - starts[out_row]
+    return out_row, out_slot
 
 
 def one_hot_multivalue_columns(
@@ -146,23 +251,36 @@ def one_hot_multivalue_columns(
     sep: str = ",",
     min_count: int = 5,
     prefix_map: Optional[Dict[str, str]] = None,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Create binary indicator columns for tokens from multi-value fields.
     Public-friendly: only materialize tokens with frequency >= min_count.
+    Indicators are stored as uint8 and attached to the frame in one step.
+    If inplace=True, the indicator columns are added to `df` itself.
     """
-    out = df.copy()
     prefix_map = prefix_map or {}
+    new_cols: Dict[str, np.ndarray] = {}
     for col in columns:
-        tokens = out[col].apply(lambda x: _split_to_list(x, sep))
-        # Frequency table
-        counts: Dict[str, int] = {}
-        for L in tokens:
-            for t in L:
-                counts[t] = counts.get(t, 0) + 1
-        keep: Set[str] = {t for t, c in counts.items() if c >= min_count}
+        flat, lengths = _tokenize_column(df[col], sep)
+        # Frequency table: hash-based factorize + bincount over all tokens
+        codes, uniques = pd.factorize(flat)
+        counts = np.bincount(codes, minlength=len(uniques))
+        kept = np.flatnonzero(counts >= min_count)
+        if not kept.size:
+            continue
+        kept = kept[np.argsort(uniques[kept])]  # indicator columns in token order
+        keep = uniques[kept].tolist()
+        # (row, token) coordinates of every kept token -> indicator matrix
+        col_of_code = np.full(len(uniques), -1, dtype=np.int64)
+        col_of_code[kept] = np.arange(len(kept))
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        cols = col_of_code[codes]
+        hit = cols >= 0
+        indicators = np.zeros((len(lengths), len(keep)), dtype=np.uint8)
+        indicators[rows[hit], cols[hit]] = 1
         pref = prefix_map.get(col, col)
-        for t in sorted(keep):
-            col_name = f"{pref}__{t}".replace(" ", "_")
-            out[col_name] = tokens.apply(lambda L, tok=t: int(tok in L))
-    return out
+        for j, t in enumerate(keep):
+            new_cols[f"{pref}__{t}".replace(" ", "_")] = indicators[:, j]
+
+    return _attach_columns(df, new_cols, inplace)
@@ -10,10 +10,11 @@ cross-table integrity, and dataset-level consistency rules.
 """
 
 from __future__ import annotations
-from typing import Iterable, Dict, List, Tuple
+from typing import Iterable, Tuple
 import pandas as pd
 import numpy as np
-import re
+
+from ._frame_utils import _result_frame
 
 # Columns surfaced in the public context (superset-friendly; missing allowed)
 REQUIRED_COLUMNS: Tuple[str, ...] = (
@@ -54,7 +55,11 @@ _NUMERIC_SUGGESTED = (
     "Number_of_channels",
 )
 
-_ID_CLEAN_RE = re.compile(r"[,\s]")
+# Deletion table for commas and every character `str.isspace` accepts (the
+# same set as the regex class `[,\s]`); the last whitespace code point is U+3000.
+_ID_DELETE_TABLE = str.maketrans(
+    "", "", "," + "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+)
 
 def validate_required_columns(df: pd.DataFrame) -> None:
     """Raise ValueError if any required column is entirely missing."""
@@ -67,18 +72,20 @@ def normalize_id_column(
     df: pd.DataFrame,
     id_col: str = "ID_accident",
     target_type: str = "string",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Normalize ID values that may appear as Excel-like strings (e.g., '2,01E+11').
     - Remove commas/whitespace
     - Optionally cast to int if safe; otherwise keep as string
+    If inplace=True, `df` itself is modified and returned.
     """
-    out = df.copy()
+    out = _result_frame(df, inplace)
     if id_col not in out.columns:
         return out
 
     s = out[id_col].astype(str).str.strip()
-    s = s.str.replace(_ID_CLEAN_RE, "", regex=True)
+    s = s.str.translate(_ID_DELETE_TABLE)
     if target_type == "int":
         # Best-effort integer cast; fall back to string on failure
         tmp = pd.to_numeric(s, errors="coerce")
@@ -95,9 +102,13 @@ def coerce_numeric_columns(
     df: pd.DataFrame,
     numeric_columns: Iterable[str] = _NUMERIC_SUGGESTED,
     errors: str = "coerce",
+    inplace: bool = False,
 ) -> pd.DataFrame:
-    """Coerce suggested numeric columns to numeric dtype."""
-    out = df.copy()
+    """
+    Coerce suggested numeric columns to numeric dtype.
+    If inplace=True, `df` itself is modified and returned.
+    """
+    out = _result_frame(df, inplace)
     for c in numeric_columns:
         if c in out.columns:
             out[c] = pd.to_numeric(out[c], errors=errors)
@@ -115,22 +126,22 @@ def basic_quality_report(df: pd.DataFrame) -> pd.DataFrame:
     - null_pct
     - n_unique (for object columns)
     - example_values (first 3 unique)
+
+    Null counts are computed once over the whole frame; unique values are
+    only collected for object columns.
     """
-    rows: List[Dict[str, object]] = []
-    for c in df.columns:
-        s = df[c]
-        non_null = int(s.notna().sum())
-        null_pct = float(s.isna().mean() * 100)
-        dtype = str(s.dtype)
-        entry: Dict[str, object] = {
-            "column": c,
-            "dtype": dtype,
-            "non_null": non_null,
-            "null_pct": round(null_pct, 2),
-        }
-        if s.dtype == "object":
-            uniq = s.dropna().unique().tolist()
-            entry["n_unique"] = len(uniq)
-            entry["example_values"] = uniq[:3]
-        rows.append(entry)
-    return pd.DataFrame(rows).sort_values(by="null_pct", ascending=False).reset_index(drop=True)
+    n = len(df)
+    non_null = df.notna().sum()
+    report = pd.DataFrame({
+        "column": df.columns,
+        "dtype": df.dtypes.astype(str).to_numpy(),
+        "non_null": non_null.to_numpy(),
+        "null_pct": ((n - non_null) / n * 100).round(2).to_numpy(),
+    })
+
+    obj_pos = [i for i, dtype in enumerate(df.dtypes) if dtype == "object"]
+    if obj_pos:
+        uniques = [df.iloc[:, i].dropna().unique().tolist() for i in obj_pos]
+        report["n_unique"] = pd.Series([len(u) for u in uniques], index=obj_pos)
+        report["example_values"] = pd.Series([u[:3] for u in uniques], index=obj_pos, dtype=object)
+    return report.sort_values(by="null_pct", ascending=False).reset_index(drop=True)
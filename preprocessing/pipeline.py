@@ -0,0 +1,91 @@
+"""
+LeADS D7.4 – Lazy Preprocessing Pipeline (Phase 1)
+MIT License
+
+Out-of-core variant of the Phase 1 loading steps for large BAAC-like CSVs:
+- build_pipeline: read_csv -> normalize_id_column -> parse_datetime_column
+  -> add_accident_time_parts, deferred with Dask
+
+Every step is a pure per-row transform, so it maps partition by partition and
+nothing is read until `.compute()` (or a reduction such as `value_counts`)
+is requested. Dask is optional and only needed for this module.
+"""
+
+from __future__ import annotations
+from typing import Union
+
+from .data_validation import normalize_id_column
+from .temporal_features import parse_datetime_column, add_accident_time_parts
+
+
+def build_pipeline(
+    path: str,
+    blocksize: Union[str, int] = "128MB",
+    id_col: str = "ID_accident",
+    source_col: str = "Date_and_hour",
+    dt_col: str = "dt",
+    **read_csv_kwargs,
+):
+    """
+    Build a lazy Dask DataFrame running the standard loading steps per partition.
+
+    Parameters
+    ----------
+    path : str
+        CSV path or glob, as accepted by ``dask.dataframe.read_csv``.
+    blocksize : str or int, default='128MB'
+        Bytes per partition.
+    id_col, source_col, dt_col : str
+        Passed to normalize_id_column / parse_datetime_column /
+        add_accident_time_parts.
+    **read_csv_kwargs
+        Forwarded to ``dask.dataframe.read_csv``. ``id_col`` is always read
+        as text (merged into a ``dtype`` dict if given). Other dtypes are
+        inferred from the first ``sample`` bytes (``sample_rows`` defaults to
+        10_000 here). If a later block has missing values in a column the
+        sample saw as integer, computing fails and names the column; pass
+        ``dtype={col: "float64"}`` for it (or ``assume_missing=True``, which
+        also turns complete integer columns into floats).
+
+    Returns
+    -------
+    dask.dataframe.DataFrame
+        Nothing is computed yet. Reduce before materializing where possible,
+        e.g. ``ddf["Month"].value_counts().compute()``.
+
+    Raises
+    ------
+    ImportError
+        If dask is not installed.
+    """
+    try:
+        import dask.dataframe as dd
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "build_pipeline requires dask; install it with `pip install \"dask[dataframe]\"`."
+        ) from exc
+
+    import dask
+
+    # Read IDs as text so large integer IDs are not turned into floats ('….0')
+    # when a block infers them differently; the eager path stringifies them too.
+    dtype = read_csv_kwargs.pop("dtype", None)
+    if dtype is None or isinstance(dtype, dict):
+        dtype = {id_col: object, **(dtype or {})}
+
+    # Infer dtypes from the whole sample (256 kB by default), not Dask's first
+    # 10 rows, so sparse integer-coded columns come out float64 as in pandas.
+    read_csv_kwargs.setdefault("sample_rows", 10_000)
+
+    # Keep text columns as object dtype, as pandas.read_csv returns them,
+    # instead of Dask's default conversion to string[pyarrow]
+    with dask.config.set({"dataframe.convert-string": False}):
+        ddf = dd.read_csv(path, blocksize=blocksize, dtype=dtype, **read_csv_kwargs)
+        ddf = ddf.map_partitions(normalize_id_column, id_col=id_col)
+        # explicit meta: inferring it would parse Dask's dummy strings and warn
+        meta = parse_datetime_column(ddf._meta, source_col=source_col, target_col=dt_col)
+        ddf = ddf.map_partitions(
+            parse_datetime_column, source_col=source_col, target_col=dt_col, meta=meta
+        )
+        ddf = ddf.map_partitions(add_accident_time_parts, dt_col=dt_col)
+    return ddf
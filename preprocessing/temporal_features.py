@@ -4,7 +4,7 @@ MIT License
 
 Public, minimal, timezone-aware temporal parsing and enrichment:
 - parse_datetime_column: parse ISO strings with timezone to UTC
-- add_accident_time_parts: Accident_Year, Date, Time, Hour, Month
+- add_accident_time_parts: Accident_Year, Hour, Month (+ optional Date, TimeSec)
 - add_temporal_features: dayofweek, weekend, part_of_day, rush_hour
 - derive_age_from_year_of_birth: numeric age from 'Year_of_birth' (clipped)
 
@@ -13,62 +13,113 @@ are part of Phase 2.
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Dict, Optional
+import warnings
 import pandas as pd
 import numpy as np
 
+from ._frame_utils import _attach_columns, _result_frame
+
+# format="ISO8601" needs pandas >= 2.0; older versions get the equivalent
+# strftime pattern for the BAAC timestamps (e.g. 2014-10-16T17:15:00+02:00).
+_PANDAS_GE_2 = int(pd.__version__.split(".")[0]) >= 2
+_ISO_FALLBACK_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
 def parse_datetime_column(
     df: pd.DataFrame,
     source_col: str = "Date_and_hour",
     target_col: str = "dt",
     utc: bool = True,
     errors: str = "coerce",
+    format: Optional[str] = "ISO8601",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Parse datetime strings (ISO with timezone) into pandas datetime.
     If utc=True, convert to UTC timezone-aware dtype.
+    The explicit ISO format avoids per-string format inference, and repeated
+    strings are parsed once (cache=True). Pass format=None for other layouts;
+    with errors='coerce' non-matching strings become NaT and a UserWarning
+    reports how many.
+    If inplace=True, `df` itself is modified and returned.
     """
-    out = df.copy()
-    s = pd.to_datetime(out[source_col], errors=errors, utc=utc)
+    out = _result_frame(df, inplace)
+    if format == "ISO8601" and not _PANDAS_GE_2:
+        format = _ISO_FALLBACK_FORMAT
+    raw = out[source_col]
+    s = pd.to_datetime(raw, format=format, errors=errors, utc=utc, cache=True)
+    if format is not None:
+        n_failed = int((s.isna() & raw.notna()).sum())
+        if n_failed:
+            warnings.warn(
+                f"{n_failed} value(s) in '{source_col}' did not match format={format!r} "
+                "and were set to NaT; pass format=None to infer other layouts.",
+                UserWarning,
+                stacklevel=2,
+            )
     out[target_col] = s
     return out
 
 
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_HOUR = 3_600 * _NS_PER_SECOND
+
+
+def _mask_nat(values: np.ndarray, nat: np.ndarray) -> np.ndarray:
+    """Return integer time parts as float with NaN where the timestamp is NaT."""
+    if nat.any():
+        values = values.astype(float)
+        values[nat] = np.nan
+    return values
+
+
 def add_accident_time_parts(
     df: pd.DataFrame,
     dt_col: str = "dt",
     year_col: str = "Accident_Year",
+    include_date_time: bool = False,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Derive standard time parts used in the EDA notebook.
-    Adds: Accident_Year, Date, Time, Hour, Month.
+    Adds: Accident_Year, Hour, Month, and with include_date_time=True also
+    Date (datetime64, day resolution) and TimeSec (seconds since midnight).
+    If inplace=True, `df` itself is modified and returned.
+
+    All parts are computed from the int64 timestamp buffer with NumPy, so no
+    per-row Python date/time objects are created.
     """
-    out = df.copy()
-    s = out[dt_col]
-    out[year_col] = s.dt.year
-    out["Date"] = s.dt.date
-    out["Time"] = s.dt.time
-    out["Hour"] = s.dt.hour
-    out["Month"] = s.dt.month
-    return out
+    s = df[dt_col]
+    # wall-clock values in the column's own timezone
+    local = s.dt.tz_localize(None) if s.dt.tz is not None else s
+    v = local.to_numpy(dtype="datetime64[ns]")
+    nat = np.isnat(v)
+    new_cols: Dict[str, object] = {
+        year_col: _mask_nat(v.astype("datetime64[Y]").view("i8").astype(np.int32) + 1970, nat)
+    }
+    if include_date_time:
+        new_cols["Date"] = v.astype("datetime64[D]")
+        new_cols["TimeSec"] = _mask_nat(((v.view("i8") // _NS_PER_SECOND) % 86_400).astype(np.int32), nat)
+    new_cols["Hour"] = _mask_nat(((v.view("i8") // _NS_PER_HOUR) % 24).astype(np.int32), nat)
+    new_cols["Month"] = _mask_nat(v.astype("datetime64[M]").view("i8").astype(np.int32) % 12 + 1, nat)
+    return _attach_columns(df, new_cols, inplace)
 
 
-def _part_of_day(hour: float) -> str:
-    if pd.isna(hour):
-        return "unknown"
-    if 5 <= hour < 12:
-        return "morning"
-    if 12 <= hour < 17:
-        return "afternoon"
-    if 17 <= hour < 21:
-        return "evening"
-    return "night"
+# Hour-of-day lookup tables (index = hour 0..23)
+_PART_OF_DAY_CATEGORIES = ["morning", "afternoon", "evening", "night", "unknown"]
+_HOUR_TO_PART_OF_DAY = np.array(["night"] * 24, dtype=object)
+_HOUR_TO_PART_OF_DAY[5:12] = "morning"
+_HOUR_TO_PART_OF_DAY[12:17] = "afternoon"
+_HOUR_TO_PART_OF_DAY[17:21] = "evening"
+_RUSH_HOUR_MASK = np.zeros(24, dtype=bool)
+_RUSH_HOUR_MASK[[7, 8, 9, 16, 17, 18, 19]] = True
 
 
 def add_temporal_features(
     df: pd.DataFrame,
     dt_col: str = "dt",
     prefix: str = "t_",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Add lightweight temporal features for EDA and simple baselines:
@@ -76,16 +127,24 @@ def add_temporal_features(
     - t_weekend (0/1)
     - t_part_of_day (categorical)
     - t_rush_hour (0/1)  -- rough proxy (7–9, 16–19)
+    If inplace=True, `df` itself is modified and returned.
     """
-    out = df.copy()
-    s = out[dt_col]
-    out[f"{prefix}dayofweek"] = s.dt.dayofweek
-    out[f"{prefix}weekend"] = out[f"{prefix}dayofweek"].isin([5, 6]).astype(int)
+    s = df[dt_col]
+    dayofweek = s.dt.dayofweek
     # prefer Hour if already present; else compute ad hoc
-    hour = out["Hour"] if "Hour" in out.columns else s.dt.hour
-    out[f"{prefix}part_of_day"] = hour.apply(_part_of_day)
-    out[f"{prefix}rush_hour"] = hour.isin([7, 8, 9, 16, 17, 18, 19]).astype(int)
-    return out
+    hour = df["Hour"] if "Hour" in df.columns else s.dt.hour
+    h = pd.to_numeric(hour, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid = (h >= 0) & (h < 24)  # False for NaN
+    idx = np.where(valid, h, 0).astype(np.int64)
+    pod = _HOUR_TO_PART_OF_DAY[idx]
+    pod[~valid] = "unknown"
+    new_cols: Dict[str, object] = {
+        f"{prefix}dayofweek": dayofweek.to_numpy(),
+        f"{prefix}weekend": dayofweek.isin([5, 6]).astype(int).to_numpy(),
+        f"{prefix}part_of_day": pd.Categorical(pod, categories=_PART_OF_DAY_CATEGORIES),
+        f"{prefix}rush_hour": (_RUSH_HOUR_MASK[idx] & valid).astype(int),
+    }
+    return _attach_columns(df, new_cols, inplace)
 
 
 def derive_age_from_year_of_birth(
@@ -94,11 +153,13 @@ def derive_age_from_year_of_birth(
     reference_year_col: str = "Accident_Year",
     target_col: str = "Age",
     clip_range: tuple[int, int] = (0, 110),
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Derive age = Accident_Year - Year_of_birth (as used in your EDA).
+    If inplace=True, `df` itself is modified and returned.
     """
-    out = df.copy()
+    out = _result_frame(df, inplace)
     # numeric coercions
     yob = pd.to_numeric(out[yob_col], errors="coerce")
     ref_year = pd.to_numeric(out[reference_year_col], errors="coerce")
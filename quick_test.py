@@ -4,7 +4,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 from preprocessing import (
-    parse_datetime_column, add_accident_time_parts, normalize_id_column
+    parse_datetime_column, add_accident_time_parts, normalize_id_column,
+    build_pipeline
 )
 from visualization import (
     plot_category_counts, plot_nulls_bar, plot_time_series_counts,
@@ -76,6 +77,16 @@ def main():
     else:
         print("Security_measures not found — skipping token bar chart.")
 
+    # 6) Lazy (Dask) pipeline must match the eager result above
+    try:
+        import dask  # noqa: F401
+    except ImportError:
+        print("dask not installed — skipping lazy pipeline check.")
+    else:
+        lazy = build_pipeline(CSV_PATH, blocksize=4096).compute().reset_index(drop=True)
+        pd.testing.assert_frame_equal(lazy, df)
+        print(f"Lazy pipeline matches eager result ({len(lazy)} rows).")
+
     # Show windows if your setup supports GUI backends
     try:
         plt.show()
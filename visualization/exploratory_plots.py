@@ -24,7 +24,8 @@ report-generation pipelines aligned with the complete D7.4 framework.
 """
 
 from __future__ import annotations
-from typing import Optional, Iterable, Tuple, List
+from collections import Counter
+from typing import Optional, Iterable, Tuple
 import math
 
 import numpy as np
@@ -37,6 +38,14 @@ def _validate_series_exists(df: pd.DataFrame, column: str) -> None:
         raise ValueError(f"Column '{column}' not found in dataframe.")
 
 
+def _barh(ax: plt.Axes, values: np.ndarray, labels: Iterable[object]) -> None:
+    """Horizontal bars drawn directly on the Axes, first value at the bottom."""
+    y = np.arange(len(values))
+    ax.barh(y, values, height=0.5)
+    ax.set_yticks(y)
+    ax.set_yticklabels([str(label) for label in labels])
+
+
 def plot_category_counts(
     df: pd.DataFrame,
     column: str,
@@ -72,7 +81,7 @@ def plot_category_counts(
         counts = counts.head(top_n)
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    counts.iloc[::-1].plot(kind="barh", ax=ax)  # horizontal for readability
+    _barh(ax, counts.to_numpy()[::-1], counts.index[::-1])  # horizontal for readability
     ax.set_xlabel("Percentage" if normalize else "Count")
     ax.set_ylabel(column)
     ax.set_title(title or f"{column} – {'Percentage' if normalize else 'Count'} (Top {top_n})")
@@ -176,7 +185,7 @@ def plot_nulls_bar(
         null_pct = null_pct.sort_values(ascending=False)
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    null_pct.plot(kind="barh", ax=ax)
+    _barh(ax, null_pct.to_numpy(), null_pct.index)
     ax.set_xlabel("Null percentage (%)")
     ax.set_ylabel("Columns")
     ax.set_title(title)
@@ -199,7 +208,7 @@ def plot_time_series_counts(
     dt_col : str, default='dt'
         Parsed datetime column (timezone-aware is fine).
     freq : {'H','D','W','M','Q','Y'}, default='M'
-        Resampling frequency.
+        Resample frequency used to bucket events (any pandas alias, e.g. '2D').
     title : str, optional
 
     Returns
@@ -208,13 +217,8 @@ def plot_time_series_counts(
     """
     _validate_series_exists(df, dt_col)
     s = pd.to_datetime(df[dt_col], errors="coerce")
-    ts = (
-        pd.Series(1, index=s)
-        .sort_index()
-        .resample(freq)
-        .sum()
-        .fillna(0)
-    )
+    # Same bins and labels as resample(), without building a Series of ones
+    ts = pd.DataFrame({"t": s}).groupby(pd.Grouper(key="t", freq=freq)).size()
 
     fig, ax = plt.subplots(figsize=(10, 5))
     ax.plot(ts.index, ts.values)
@@ -232,9 +236,11 @@ def plot_geo_scatter(
     title: str = "Accidents – Latitude/Longitude (raw scatter)",
     alpha: float = 0.6,
     size: int = 20,
+    hexbin_threshold: Optional[int] = 50_000,
 ) -> plt.Axes:
     """
     Simple latitude/longitude scatter (no basemap).
+    Above `hexbin_threshold` points a hexbin density plot is drawn instead.
 
     Parameters
     ----------
@@ -244,6 +250,10 @@ def plot_geo_scatter(
     title : str
     alpha : float, default=0.6
     size : int, default=20
+    hexbin_threshold : int or None, default=50_000
+        Switch to ``ax.hexbin`` when more valid points than this are present,
+        so drawing cost depends on the grid instead of the row count.
+        None always draws the raw scatter.
 
     Returns
     -------
@@ -264,7 +274,10 @@ def plot_geo_scatter(
     lon = lon[mask]
 
     fig, ax = plt.subplots(figsize=(7, 7))
-    ax.scatter(lon.values, lat.values, s=size, alpha=alpha)
+    if hexbin_threshold is not None and len(lat) > hexbin_threshold:
+        ax.hexbin(lon.values, lat.values, gridsize=200, mincnt=1)
+    else:
+        ax.scatter(lon.values, lat.values, s=size, alpha=alpha)
     ax.set_xlabel(lon_col)
     ax.set_ylabel(lat_col)
     ax.set_title(title)
@@ -307,25 +320,23 @@ def plot_multivalue_token_counts(
     """
     _validate_series_exists(df, column)
 
-    # Split and flatten
-    def _split(x) -> List[str]:
-        if pd.isna(x):
-            return []
-        return [t.strip() for t in str(x).split(sep) if t is not None and t.strip() != ""]
-
-    tokens = df[column].apply(_split)
-    all_tokens = [t for L in tokens for t in L]
+    # Count tokens in a single scan, without materializing per-row token lists
+    token_counts: Counter = Counter()
+    for x in df[column].dropna().to_numpy(dtype=object):
+        for t in str(x).split(sep):
+            t = t.strip()
+            if t:
+                token_counts[t] += 1
 
-    if len(all_tokens) == 0:
+    if not token_counts:
         raise ValueError(f"No tokens found in column '{column}' using sep='{sep}'.")
 
-    s = pd.Series(all_tokens)
-    counts = s.value_counts(normalize=normalize)
-    if top_n is not None:
-        counts = counts.head(top_n)
+    counts = pd.Series(dict(token_counts.most_common(top_n)))
+    if normalize:
+        counts = counts / sum(token_counts.values())
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    counts.iloc[::-1].plot(kind="barh", ax=ax)
+    _barh(ax, counts.to_numpy()[::-1], counts.index[::-1])
     ax.set_xlabel("Percentage" if normalize else "Count")
     ax.set_ylabel(f"{column} tokens")
     ax.set_title(title or f"{column} – token {'percentage' if normalize else 'count'} (Top {top_n})")